@@ -11,7 +11,8 @@ __email__ = "shayan.mousavi@nrc-cnrc.gc.ca"
 from .data_processing import (
     sift_data_extractor,
     successful_sift_extraction,
-    ppm_threshold
+    ppm_threshold,
+    ppm_threshold_vec
 )
 
 from .surrogate_generation import (
@@ -41,6 +42,7 @@ __all__ = [
     'sift_data_extractor',
     'successful_sift_extraction', 
     'ppm_threshold',
+    'ppm_threshold_vec',
     
     # Surrogate generation
     'latin_hypercube_sample',
@@ -6,13 +6,262 @@ from the Data directory in the HITL-AL framework.
 """
 
 import os
+import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Dict, Optional, Tuple
 from .data_processing import sift_data_extractor, successful_sift_extraction
 
+# Prefer the Rust calamine Excel parser (pandas >= 2.2 with python-calamine);
+# otherwise let pandas pick its default engine (openpyxl / xlrd)
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = "calamine" if tuple(map(int, pd.__version__.split(".")[:2])) >= (2, 2) else None
+except ImportError:
+    _EXCEL_ENGINE = None
 
-def load_cleaned_data(data_dir: str = "Data/clean") -> pd.DataFrame:
+# Numba is optional; without it the derived features are computed with NumPy
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Below this many rows the NumPy expressions are faster than the kernel
+_NUMBA_MIN_ROWS = 100_000
+
+if _NUMBA_AVAILABLE:
+    # Serial on purpose: the loop is memory-bound, and a parallel kernel starts
+    # Numba's threading layer, after which fork-based process pools hang at exit
+    @njit(cache=True)
+    def _derive_features_numba(t_hot, t_cold, fini_mg):
+        """Compute delta_T and the battery-grade label in one fused pass."""
+        n = t_hot.shape[0]
+        delta_t = np.empty(n, np.float32)
+        bg = np.empty(n, np.int8)
+        for i in range(n):
+            delta_t[i] = t_hot[i] - t_cold[i]
+            bg[i] = 1 if fini_mg[i] < 80 else 0
+        return delta_t, bg
+
+
+def _read_files_parallel(reader: Callable[[str], Any],
+                         file_paths: List[str],
+                         max_workers: int = 8) -> List[Any]:
+    """
+    Read several files concurrently, preserving the input order.
+    
+    Parameters:
+    -----------
+    reader : Callable[[str], Any]
+        Function that loads a single file path (e.g. ``pd.read_csv``)
+    file_paths : List[str]
+        Paths of the files to load
+    max_workers : int, default=8
+        Upper bound on the number of reader threads
+        
+    Returns:
+    --------
+    List[Any]
+        One entry per path, in the order of ``file_paths``: either the
+        loaded object or the exception raised while reading it
+        
+    Notes:
+    ------
+    The pandas CSV/Excel parsers and ``np.load`` spend most of their time in
+    I/O and C code that releases the GIL, so threads overlap the reads.
+    """
+    def _load(file_path):
+        try:
+            return reader(file_path)
+        except Exception as e:
+            return e
+    
+    if not file_paths:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        return list(executor.map(_load, file_paths))
+
+
+def _list_files(data_dir: str, extensions: Tuple[str, ...]) -> List[str]:
+    """
+    Return the sorted names of the files in ``data_dir`` with the given extensions.
+    
+    ``os.scandir`` reports the entry type from the directory listing itself,
+    so no separate ``stat`` call is made per file.
+    """
+    with os.scandir(data_dir) as entries:
+        return sorted(entry.name for entry in entries
+                      if entry.name.endswith(extensions) and entry.is_file())
+
+
+def _files_digest(file_paths: List[str], *options: Any) -> str:
+    """
+    Hash each file's path, modification time and size together with any
+    reader options, so that editing or replacing an input file changes it.
+    """
+    stamps = sorted((os.path.abspath(p), os.path.getmtime(p), os.path.getsize(p)) for p in file_paths)
+    return hashlib.sha1(repr((stamps, options)).encode()).hexdigest()[:16]
+
+
+def _cache_path(cache_dir: Optional[str], prefix: str, file_paths: List[str],
+                *options: Any) -> Optional[str]:
+    """
+    Build the Parquet cache path for a set of input files.
+    
+    The name is ``<prefix>_<inputs>_<digest>.parquet``: ``inputs`` hashes the
+    file paths and reader options only, while ``digest`` (_files_digest) also
+    covers modification times and sizes, so stale caches are never reused and
+    _write_cache can find and remove them. Returns None when caching is disabled.
+    """
+    if cache_dir is None:
+        return None
+    inputs = hashlib.sha1(repr((sorted(map(os.path.abspath, file_paths)), options)).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{prefix}_{inputs}_{_files_digest(file_paths, *options)}.parquet")
+
+
+def _read_cache(cache_path: Optional[str]) -> Optional[pd.DataFrame]:
+    """Return the cached DataFrame, or None if there is no usable cache file."""
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception:
+        return None
+
+
+def _write_cache(data: pd.DataFrame, cache_path: Optional[str]) -> None:
+    """
+    Persist a DataFrame to the Parquet cache.
+    
+    Older caches of the same inputs (same name up to the digest) are removed,
+    so the cache directory holds one file per input set. Failures (no Parquet
+    engine installed, mixed-type object columns, read-only directory) are
+    ignored: the cache is an optimisation only.
+    """
+    if cache_path is None:
+        return
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        cache_dir = os.path.dirname(cache_path) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+        data.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+        stale_prefix = os.path.basename(cache_path).rsplit("_", 1)[0] + "_"
+        for name in os.listdir(cache_dir):
+            if name.startswith(stale_prefix) and name.endswith(".parquet") \
+                    and name != os.path.basename(cache_path):
+                os.remove(os.path.join(cache_dir, name))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _cached_reader(reader: Callable[[str], pd.DataFrame], cache_dir: Optional[str],
+                   prefix: str, *options: Any) -> Callable[[str], pd.DataFrame]:
+    """Wrap a single-file reader so its result is cached to Parquet per file."""
+    if cache_dir is None:
+        return reader
+    
+    def _read(file_path):
+        cache_path = _cache_path(cache_dir, prefix, [file_path], *options)
+        data = _read_cache(cache_path)
+        if data is None:
+            data = reader(file_path)
+            _write_cache(data, cache_path)
+        return data
+    return _read
+
+
+def _arrow_csv_reader(dtype: Optional[Dict[str, Any]] = None) -> Callable[[str], Any]:
+    """
+    Return a function that reads a CSV file into a ``pyarrow.Table``.
+    
+    Arrow's reader tokenizes in parallel blocks; ``dtype`` maps column names
+    to NumPy dtypes and is converted to the equivalent Arrow column types.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        raise ImportError("engine='pyarrow' requires the pyarrow package")
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=1 << 20)
+    convert_options = pa_csv.ConvertOptions(
+        column_types={col: pa.from_numpy_dtype(np.dtype(t)) for col, t in (dtype or {}).items()}
+    )
+    
+    def _read(file_path):
+        return pa_csv.read_csv(file_path, read_options=read_options,
+                               convert_options=convert_options)
+    return _read
+
+
+def _csv_reader(engine: str = "pandas",
+                dtype: Optional[Dict[str, Any]] = None) -> Callable[[str], pd.DataFrame]:
+    """
+    Return a function that reads a CSV file into a pandas DataFrame.
+    
+    Parameters:
+    -----------
+    engine : str, default="pandas"
+        CSV parser to use: "pandas", "pyarrow" or "polars"
+    dtype : Dict[str, Any], optional
+        Column dtypes to parse with, so every file yields the same schema
+        
+    Returns:
+    --------
+    Callable[[str], pd.DataFrame]
+        Reader taking a file path
+        
+    Notes:
+    ------
+    The pyarrow and polars engines are optional dependencies; they parse with
+    multithreaded native readers and convert the result to a regular
+    NumPy-backed DataFrame, so downstream code sees the same dtypes.
+    """
+    if engine == "pandas":
+        return partial(pd.read_csv, dtype=dtype)
+    
+    if engine == "pyarrow":
+        read_table = _arrow_csv_reader(dtype)
+        
+        def _read(file_path):
+            return read_table(file_path).to_pandas()
+        return _read
+    
+    if engine == "polars":
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("engine='polars' requires the polars package")
+        
+        def _read(file_path):
+            data = pl.read_csv(file_path, rechunk=False).to_pandas()
+            if dtype:
+                data = data.astype({col: t for col, t in dtype.items() if col in data.columns})
+            return data
+        return _read
+    
+    raise ValueError(f"Unknown CSV engine: {engine}. Use 'pandas', 'pyarrow' or 'polars'")
+
+
+def _load_generated_file(file_path: str,
+                         read_csv: Callable[[str], pd.DataFrame] = pd.read_csv,
+                         mmap_mode: Optional[str] = None) -> Any:
+    """Load a generated CSV as a DataFrame or a ``.npy`` file as an array."""
+    if file_path.endswith('.csv'):
+        return read_csv(file_path)
+    return np.load(file_path, mmap_mode=mmap_mode)
+
+
+def load_cleaned_data(data_dir: str = "Data/clean", engine: str = "pandas",
+                      dtype: Optional[Dict[str, Any]] = None,
+                      cache_dir: Optional[str] = ".cache",
+                      strict: bool = False) -> pd.DataFrame:
     """
     Load all cleaned experimental data from the clean data directory.
     
@@ -20,6 +269,18 @@ def load_cleaned_data(data_dir: str = "Data/clean") -> pd.DataFrame:
     -----------
     data_dir : str, default="Data/clean"
         Path to the cleaned data directory
+    engine : str, default="pandas"
+        CSV parser: "pandas", or the faster optional "pyarrow" / "polars"
+    dtype : Dict[str, Any], optional
+        Column dtypes applied while parsing, so every file produces the same
+        schema and the files concatenate without upcasting
+    cache_dir : str, optional, default=".cache"
+        Directory for the Parquet cache of the combined dataset. The cache is
+        keyed on the CSV files' modification times, the engine and the dtypes,
+        since engines may parse the same column differently; None disables it
+    strict : bool, default=False
+        If True, raise ValueError when any file fails to load instead of
+        skipping it with a message
         
     Returns:
     --------
@@ -34,33 +295,243 @@ def load_cleaned_data(data_dir: str = "Data/clean") -> pd.DataFrame:
     if not os.path.exists(data_dir):
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
     
-    data_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
+    data_files = _list_files(data_dir, ('.csv',))
     if not data_files:
         raise FileNotFoundError(f"No CSV files found in {data_dir}")
     
+    file_paths = [os.path.join(data_dir, file) for file in data_files]
+    cache_path = _cache_path(cache_dir, "cleaned", file_paths, engine, dtype)
+    cached_data = _read_cache(cache_path)
+    if cached_data is not None:
+        print(f"Loaded {len(data_files)} files from cache {cache_path}")
+        print(f"\nTotal experiments loaded: {len(cached_data)}")
+        return cached_data
+    
+    # With pyarrow, keep the per-file results as Arrow tables and convert once
+    # after concatenation instead of building and copying pandas frames
+    if engine == "pyarrow":
+        import pyarrow as pa
+        read_csv = _arrow_csv_reader(dtype)
+    else:
+        read_csv = _csv_reader(engine, dtype)
     combined_data = []
     
-    for file in data_files:
-        file_path = os.path.join(data_dir, file)
-        try:
-            data = pd.read_csv(file_path)
-            data['source_file'] = file  # Track source file
-            combined_data.append(data)
-            print(f"Loaded {file}: {len(data)} experiments")
-        except Exception as e:
-            print(f"Error loading {file}: {e}")
+    for file, data in zip(data_files, _read_files_parallel(read_csv, file_paths)):
+        if isinstance(data, Exception):
+            print(f"Error loading {file}: {data}")
+            continue
+        # Track source file
+        if engine == "pyarrow":
+            data = data.append_column('source_file', pa.array([file] * data.num_rows))
+        else:
+            data['source_file'] = file
+        combined_data.append(data)
+        print(f"Loaded {file}: {len(data)} experiments")
     
     if not combined_data:
         raise ValueError("No data could be loaded from any files")
+    if strict and len(combined_data) != len(data_files):
+        raise ValueError(f"Only {len(combined_data)} of {len(data_files)} files in {data_dir} could be loaded")
     
     # Combine all datasets
-    final_data = pd.concat(combined_data, ignore_index=True)
+    if engine == "pyarrow":
+        final_data = pa.concat_tables(combined_data, promote_options="permissive").to_pandas()
+    else:
+        final_data = pd.concat(combined_data, ignore_index=True, copy=False)
     print(f"\nTotal experiments loaded: {len(final_data)}")
     
+    if len(combined_data) == len(data_files):
+        _write_cache(final_data, cache_path)
+    
     return final_data
 
 
-def load_raw_data(data_dir: str = "Data/raw") -> Dict[str, pd.DataFrame]:
+def iter_cleaned_data(data_dir: str = "Data/clean",
+                      chunksize: int = 100_000,
+                      dtype: Optional[Dict[str, Any]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream cleaned experimental data in bounded-size chunks.
+    
+    Parameters:
+    -----------
+    data_dir : str, default="Data/clean"
+        Path to the cleaned data directory
+    chunksize : int, default=100_000
+        Maximum number of rows per yielded chunk
+    dtype : Dict[str, Any], optional
+        Column dtypes applied while parsing
+        
+    Yields:
+    -------
+    pd.DataFrame
+        Consecutive row chunks of each CSV file, with a ``source_file`` column
+        
+    Notes:
+    ------
+    Unlike load_cleaned_data(), the combined dataset is never held in memory,
+    so aggregations can be computed incrementally over collections of any size.
+    """
+    if not os.path.exists(data_dir):
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
+    
+    data_files = _list_files(data_dir, ('.csv',))
+    if not data_files:
+        raise FileNotFoundError(f"No CSV files found in {data_dir}")
+    
+    for file in data_files:
+        with pd.read_csv(os.path.join(data_dir, file), chunksize=chunksize, dtype=dtype) as reader:
+            for chunk in reader:
+                chunk['source_file'] = file
+                yield chunk
+
+
+def write_cleaned_dataset(cleaned_data: pd.DataFrame,
+                          dataset_dir: str = "Data/clean_parquet") -> None:
+    """
+    Write cleaned experimental data as a Parquet dataset.
+    
+    Parameters:
+    -----------
+    cleaned_data : pd.DataFrame
+        Combined cleaned dataset, e.g. from load_cleaned_data()
+    dataset_dir : str, default="Data/clean_parquet"
+        Output directory; must not contain other data
+        
+    Notes:
+    ------
+    The dataset is hive-partitioned on ``source_file`` when that column is
+    present, so each experiment campaign is stored in its own directory.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    
+    table = pa.Table.from_pandas(cleaned_data, preserve_index=False)
+    partitioning = ['source_file'] if 'source_file' in table.column_names else None
+    ds.write_dataset(table, dataset_dir, format='parquet',
+                     partitioning=partitioning, partitioning_flavor='hive')
+
+
+def _is_parquet_tree(path: str) -> bool:
+    """Return True if every file under ``path`` is a Parquet file."""
+    return all(file.endswith('.parquet')
+               for _, _, files in os.walk(path) for file in files)
+
+
+def sync_cleaned_dataset(data_dir: str = "Data/clean",
+                         dataset_dir: str = "Data/clean_parquet",
+                         engine: str = "pandas") -> str:
+    """
+    Make sure the Parquet dataset reflects the current cleaned CSV files.
+    
+    Parameters:
+    -----------
+    data_dir : str, default="Data/clean"
+        Path to the cleaned data directory
+    dataset_dir : str, default="Data/clean_parquet"
+        Parquet dataset directory
+    engine : str, default="pandas"
+        CSV parser used when the dataset has to be rebuilt
+        
+    Returns:
+    --------
+    str
+        Path of the up-to-date dataset
+        
+    Notes:
+    ------
+    The dataset is rebuilt from the CSV files only when one of them was
+    added, removed or modified since it was written; otherwise this is a
+    cheap metadata check. A rebuilt dataset is written to a temporary sibling
+    directory and moved into place only once complete.
+    """
+    if not os.path.exists(data_dir):
+        raise FileNotFoundError(f"Data directory not found: {data_dir}")
+    
+    file_paths = [os.path.join(data_dir, f) for f in _list_files(data_dir, ('.csv',))]
+    digest = _files_digest(file_paths)
+    stamp_path = os.path.join(dataset_dir, "_SOURCE_DIGEST")
+    
+    if os.path.exists(stamp_path):
+        with open(stamp_path) as f:
+            if f.read().strip() == digest:
+                return dataset_dir
+    elif os.path.exists(dataset_dir) and not _is_parquet_tree(dataset_dir):
+        # Only remove directories holding nothing but a Parquet dataset
+        raise FileExistsError(f"{dataset_dir} exists and is not a Parquet dataset")
+    
+    # The Parquet files are read straight back from the dataset, so the
+    # combined-CSV cache would only store the same data a second time
+    # strict: a dataset missing an unreadable file must not be stamped as
+    # matching the current CSVs, or later calls would serve it silently
+    cleaned_data = load_cleaned_data(data_dir, engine=engine, cache_dir=None, strict=True)
+    
+    # Build and stamp the dataset next to the old one, then swap it in, so an
+    # interrupted run never leaves a partial dataset at dataset_dir
+    tmp_dir = f"{dataset_dir.rstrip(os.sep)}.{os.getpid()}.tmp"
+    try:
+        write_cleaned_dataset(cleaned_data, tmp_dir)
+        with open(os.path.join(tmp_dir, "_SOURCE_DIGEST"), "w") as f:
+            f.write(digest)
+        if os.path.exists(dataset_dir):
+            shutil.rmtree(dataset_dir)
+        os.replace(tmp_dir, dataset_dir)
+    finally:
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+    print(f"Wrote Parquet dataset to {dataset_dir}")
+    
+    return dataset_dir
+
+
+def load_cleaned_dataset(dataset_dir: str = "Data/clean_parquet",
+                         columns: Optional[List[str]] = None,
+                         successful_only: bool = False) -> pd.DataFrame:
+    """
+    Load cleaned experimental data from the Parquet dataset.
+    
+    Parameters:
+    -----------
+    dataset_dir : str, default="Data/clean_parquet"
+        Parquet dataset directory written by write_cleaned_dataset()
+    columns : List[str], optional
+        Columns to read. Columns missing from the dataset are ignored.
+        If None, all columns are read
+    successful_only : bool, default=False
+        If True, only read rows whose ``success`` flag is 'T'
+        
+    Returns:
+    --------
+    pd.DataFrame
+        Cleaned dataset
+        
+    Notes:
+    ------
+    Only the requested columns are read from disk, and the success filter is
+    pushed down into the Parquet scan, so unused data is never materialized.
+    """
+    import pyarrow.dataset as ds
+    
+    if not os.path.exists(dataset_dir):
+        raise FileNotFoundError(f"Dataset directory not found: {dataset_dir}")
+    
+    dataset = ds.dataset(dataset_dir, format='parquet', partitioning='hive',
+                         exclude_invalid_files=True)
+    if columns is not None:
+        columns = [col for col in columns if col in dataset.schema.names]
+    row_filter = ds.field('success') == 'T' if successful_only else None
+    
+    table = dataset.to_table(columns=columns, filter=row_filter, use_threads=True)
+    data = table.to_pandas()
+    print(f"Loaded {len(data)} experiments from {dataset_dir}")
+    
+    return data
+
+
+def load_raw_data(data_dir: str = "Data/raw",
+                  usecols: Optional[List[str]] = None,
+                  nrows: Optional[int] = None,
+                  skiprows: Optional[int] = None,
+                  cache_dir: Optional[str] = ".cache") -> Dict[str, pd.DataFrame]:
     """
     Load raw experimental data from Excel files.
     
@@ -68,6 +539,15 @@ def load_raw_data(data_dir: str = "Data/raw") -> Dict[str, pd.DataFrame]:
     -----------
     data_dir : str, default="Data/raw"
         Path to the raw data directory
+    usecols : List[str], optional
+        Only parse these columns of each workbook
+    nrows : int, optional
+        Number of rows to parse from each workbook
+    skiprows : int, optional
+        Number of leading rows to skip in each workbook
+    cache_dir : str, optional, default=".cache"
+        Directory for per-file Parquet caches of the parsed workbooks;
+        None disables caching
         
     Returns:
     --------
@@ -77,30 +557,37 @@ def load_raw_data(data_dir: str = "Data/raw") -> Dict[str, pd.DataFrame]:
     Notes:
     ------
     This function loads all Excel files from the raw data directory
-    and returns them as a dictionary for individual processing.
+    and returns them as a dictionary for individual processing. Workbooks
+    are parsed with the calamine engine when python-calamine is installed.
     """
     if not os.path.exists(data_dir):
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
     
-    excel_files = [f for f in os.listdir(data_dir) if f.endswith(('.xlsx', '.xls'))]
+    excel_files = _list_files(data_dir, ('.xlsx', '.xls'))
     if not excel_files:
         raise FileNotFoundError(f"No Excel files found in {data_dir}")
     
     raw_data = {}
     
-    for file in excel_files:
-        file_path = os.path.join(data_dir, file)
-        try:
-            data = pd.read_excel(file_path)
-            raw_data[file] = data
-            print(f"Loaded {file}: {len(data)} experiments")
-        except Exception as e:
-            print(f"Error loading {file}: {e}")
+    read_excel = partial(pd.read_excel, engine=_EXCEL_ENGINE, usecols=usecols,
+                         nrows=nrows, skiprows=skiprows)
+    # The engine is part of the key: calamine and openpyxl may parse cells differently
+    read_excel = _cached_reader(read_excel, cache_dir, "raw", _EXCEL_ENGINE, usecols, nrows, skiprows)
+    file_paths = [os.path.join(data_dir, file) for file in excel_files]
+    for file, data in zip(excel_files, _read_files_parallel(read_excel, file_paths)):
+        if isinstance(data, Exception):
+            print(f"Error loading {file}: {data}")
+            continue
+        raw_data[file] = data
+        print(f"Loaded {file}: {len(data)} experiments")
     
     return raw_data
 
 
-def load_generated_data(data_dir: str = "Data/generated") -> Dict[str, pd.DataFrame]:
+def load_generated_data(data_dir: str = "Data/generated",
+                        engine: str = "pandas",
+                        mmap: bool = True,
+                        cache_dir: Optional[str] = ".cache") -> Dict[str, pd.DataFrame]:
     """
     Load AI-generated experimental designs and results.
     
@@ -108,6 +595,14 @@ def load_generated_data(data_dir: str = "Data/generated") -> Dict[str, pd.DataFr
     -----------
     data_dir : str, default="Data/generated"
         Path to the generated data directory
+    engine : str, default="pandas"
+        CSV parser: "pandas", or the faster optional "pyarrow" / "polars"
+    mmap : bool, default=True
+        If True, memory-map ``.npy`` files read-only instead of reading them
+        into RAM. Copy an array (``np.array(arr)``) before modifying it
+    cache_dir : str, optional, default=".cache"
+        Directory for per-file Parquet caches of the parsed CSV files;
+        None disables caching
         
     Returns:
     --------
@@ -117,51 +612,44 @@ def load_generated_data(data_dir: str = "Data/generated") -> Dict[str, pd.DataFr
     Notes:
     ------
     This function loads AI-generated experimental designs, surrogate data,
-    and comparative analysis results.
+    and comparative analysis results from ``data_dir`` and all of its
+    subdirectories. Keys are paths relative to ``data_dir``.
     """
     if not os.path.exists(data_dir):
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
     
     generated_data = {}
     
-    # Load CSV files
-    csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
-    for file in csv_files:
-        file_path = os.path.join(data_dir, file)
-        try:
-            data = pd.read_csv(file_path)
-            generated_data[file] = data
-            print(f"Loaded {file}: {len(data)} rows")
-        except Exception as e:
-            print(f"Error loading {file}: {e}")
-    
-    # Load NPY files (numpy arrays)
-    npy_files = [f for f in os.listdir(data_dir) if f.endswith('.npy')]
-    for file in npy_files:
-        file_path = os.path.join(data_dir, file)
-        try:
-            data = np.load(file_path)
-            generated_data[file] = data
-            print(f"Loaded {file}: shape {data.shape}")
-        except Exception as e:
-            print(f"Error loading {file}: {e}")
-    
-    # Load files from subdirectories
-    for subdir in os.listdir(data_dir):
-        subdir_path = os.path.join(data_dir, subdir)
-        if os.path.isdir(subdir_path):
-            for file in os.listdir(subdir_path):
-                if file.endswith(('.csv', '.npy')):
-                    file_path = os.path.join(subdir_path, file)
-                    try:
-                        if file.endswith('.csv'):
-                            data = pd.read_csv(file_path)
-                        else:
-                            data = np.load(file_path)
-                        generated_data[f"{subdir}/{file}"] = data
-                        print(f"Loaded {subdir}/{file}")
-                    except Exception as e:
-                        print(f"Error loading {subdir}/{file}: {e}")
+    # Collect CSV and NPY files in one walk over the tree, keyed by their
+    # path relative to data_dir so that every file is read exactly once
+    files_to_load = {}
+    npz_files = []
+    for root, dirs, files in os.walk(data_dir):
+        dirs.sort()
+        for file in sorted(files):
+            file_path = os.path.join(root, file)
+            key = os.path.relpath(file_path, data_dir).replace(os.sep, '/')
+            if file.endswith(('.csv', '.npy')):
+                files_to_load[key] = file_path
+            elif file.endswith('.npz'):
+                npz_files.append(key)
+    
+    # .npz archives hold several arrays under one name and are not loaded
+    for key in npz_files:
+        print(f"Warning: skipping {key}: .npz archives are not loaded, save arrays as .npy")
+    
+    read_csv = _cached_reader(_csv_reader(engine), cache_dir, "generated", engine)
+    reader = partial(_load_generated_file, read_csv=read_csv, mmap_mode="r" if mmap else None)
+    results = _read_files_parallel(reader, list(files_to_load.values()))
+    for key, data in zip(files_to_load, results):
+        if isinstance(data, Exception):
+            print(f"Error loading {key}: {data}")
+        elif isinstance(data, pd.DataFrame):
+            generated_data[key] = data
+            print(f"Loaded {key}: {len(data)} rows")
+        else:
+            generated_data[key] = data
+            print(f"Loaded {key}: shape {data.shape}")
     
     return generated_data
 
@@ -189,7 +677,9 @@ def prepare_analysis_dataset(cleaned_data: pd.DataFrame,
     Notes:
     ------
     This function prepares the dataset for machine learning analysis
-    by defining the feature and target variables.
+    by defining the feature and target variables. The derived delta_T and
+    bg (battery grade) columns are computed when requested and missing;
+    ``cleaned_data`` itself is not modified.
     """
     # Default feature columns
     if feature_columns is None:
@@ -202,27 +692,52 @@ def prepare_analysis_dataset(cleaned_data: pd.DataFrame,
     if target_columns is None:
         target_columns = ['fini_Mg', 'fini_K', 'fini_Li_purity', 'fini_Ca', 'fini_Na']
     
-    # Add delta_T if not present
-    if 'delta_T' not in cleaned_data.columns and 'T_cold' in cleaned_data.columns and 'T_hot' in cleaned_data.columns:
-        cleaned_data['delta_T'] = cleaned_data['T_hot'] - cleaned_data['T_cold']
-    
-    # Add battery grade label if not present
-    if 'bg' not in cleaned_data.columns and 'fini_Mg' in cleaned_data.columns:
-        cleaned_data['bg'] = np.where(cleaned_data['fini_Mg'] < 80, 1, 0)
+    # Derive engineered columns as arrays rather than adding them to the
+    # caller's DataFrame, and only those the analysis actually asks for
+    derived = {}
+    requested = set(feature_columns) | set(target_columns)
+    need_delta_t = ('delta_T' in requested and 'delta_T' not in cleaned_data.columns
+                    and 'T_cold' in cleaned_data.columns and 'T_hot' in cleaned_data.columns)
+    need_bg = 'bg' in requested and 'bg' not in cleaned_data.columns and 'fini_Mg' in cleaned_data.columns
+    
+    if need_delta_t and need_bg and _NUMBA_AVAILABLE and len(cleaned_data) >= _NUMBA_MIN_ROWS:
+        derived['delta_T'], derived['bg'] = _derive_features_numba(
+            cleaned_data['T_hot'].to_numpy(dtype=np.float64),
+            cleaned_data['T_cold'].to_numpy(dtype=np.float64),
+            cleaned_data['fini_Mg'].to_numpy(dtype=np.float64)
+        )
+    else:
+        if need_delta_t:
+            derived['delta_T'] = cleaned_data['T_hot'].to_numpy() - cleaned_data['T_cold'].to_numpy()
+        
+        # Battery grade label
+        if need_bg:
+            derived['bg'] = (cleaned_data['fini_Mg'].to_numpy() < 80).astype(np.int8)
     
     # Filter to include only available columns
-    available_features = [col for col in feature_columns if col in cleaned_data.columns]
-    available_targets = [col for col in target_columns if col in cleaned_data.columns]
+    available_features = [col for col in feature_columns if col in cleaned_data.columns or col in derived]
+    available_targets = [col for col in target_columns if col in cleaned_data.columns or col in derived]
     
     # Select relevant columns
     analysis_columns = available_features + available_targets
     if 'experiment_id' in cleaned_data.columns:
         analysis_columns.append('experiment_id')
     
-    analysis_data = cleaned_data[analysis_columns].copy()
+    # Assemble the analysis frame in one step from the column arrays
+    analysis_data = pd.DataFrame(
+        {col: derived[col] if col in derived else cleaned_data[col].to_numpy()
+         for col in analysis_columns},
+        index=cleaned_data.index,
+        copy=False
+    )
     
     # Remove rows with missing values
-    analysis_data = analysis_data.dropna()
+    analysis_data.dropna(inplace=True)
+    
+    # Measurements carry at most 4 significant digits; float32 halves the
+    # memory traffic of the downstream SHAP and correlation passes
+    analysis_data = analysis_data.astype({col: np.float32
+                                          for col in available_features + available_targets})
     
     print(f"Analysis dataset prepared:")
     print(f"  Features: {available_features}")
@@ -246,25 +761,52 @@ def get_data_summary(data: pd.DataFrame) -> Dict[str, Any]:
     Dict[str, Any]
         Summary statistics and information
     """
+    # Classify columns in a single pass over the dtypes
+    dtypes = data.dtypes
+    numeric_columns, categorical_columns, date_columns = [], [], []
+    for col, dtype in dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_numeric_dtype(dtype):
+            numeric_columns.append(col)
+        elif pd.api.types.is_object_dtype(dtype):
+            categorical_columns.append(col)
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            date_columns.append(col)
+    
+    # Count missing values with one isnan over the numeric block; only the
+    # remaining columns go through pandas' isna
+    missing_counts = {}
+    if numeric_columns:
+        numeric_values = data[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing_counts.update(zip(numeric_columns, np.isnan(numeric_values).sum(axis=0).tolist()))
+    other_columns = [col for col in data.columns if col not in missing_counts]
+    if other_columns:
+        missing_counts.update(data[other_columns].isna().sum().to_dict())
+    
     summary = {
         'total_experiments': len(data),
         'total_features': len(data.columns),
-        'missing_values': data.isnull().sum().to_dict(),
-        'data_types': data.dtypes.to_dict(),
-        'numeric_columns': data.select_dtypes(include=[np.number]).columns.tolist(),
-        'categorical_columns': data.select_dtypes(include=['object']).columns.tolist(),
-        'date_columns': data.select_dtypes(include=['datetime']).columns.tolist()
+        'missing_values': {col: missing_counts[col] for col in data.columns},
+        'data_types': dtypes.to_dict(),
+        'numeric_columns': numeric_columns,
+        'categorical_columns': categorical_columns,
+        'date_columns': date_columns
     }
     
-    # Add descriptive statistics for numeric columns
-    if summary['numeric_columns']:
-        summary['descriptive_stats'] = data[summary['numeric_columns']].describe().to_dict()
+    # Add descriptive statistics for numeric columns (no percentiles, which
+    # would require sorting every column)
+    if numeric_columns:
+        summary['descriptive_stats'] = data[numeric_columns].agg(
+            ['count', 'mean', 'std', 'min', 'max']).to_dict()
     
-    # Add value counts for categorical columns
-    if summary['categorical_columns']:
+    # Add value counts for categorical columns (in order of first appearance)
+    if categorical_columns:
         summary['categorical_counts'] = {}
-        for col in summary['categorical_columns']:
-            summary['categorical_counts'][col] = data[col].value_counts().to_dict()
+        for col in categorical_columns:
+            codes, uniques = pd.factorize(data[col], sort=False)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            summary['categorical_counts'][col] = dict(zip(uniques, counts.tolist()))
     
     return summary
 
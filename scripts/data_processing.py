@@ -7,7 +7,108 @@ experimental data from SIFT (Selective Ion Flotation Technology) experiments.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+
+# Raw SIFT column names mapped to their standardized names, grouped by the
+# sift_data_extractor flag that enables them
+_RENAME_MAP = {
+    'basic': {
+        'Experiment ID': 'experiment_id',
+        'Successful Experiment': 'success'
+    },
+    'score': {
+        'Success score': 'score'
+    },
+    'process': {
+        'T cold (deg C)': 'T_cold',
+        'T hot (deg C)': 'T_hot',
+        'flow rate (mL/min)': 'flow_rate',
+        'slurry concentration (g total solid/100 mL)': 'slurry_concentration'
+    },
+    'pH': {
+        'pH of slurry (initial)': 'pH'
+    },
+    'NaOH': {
+        'millimoles NaOH added': 'NaOH'
+    },
+    'slurry': {
+        'slurry concentration (g CaCO3/100 mL)': 'scl_Ca',
+        'slurry concentration (g K2CO3/100 mL)': 'scl_K',
+        'slurry concentration (g Li2CO3/100 mL)': 'scl_Li',
+        'slurry concentration (g (Mg(CO3))4 Mg(OH)2/100 mL)': 'scl_Mg',
+        'slurry concentration (g Na2CO3/100 mL)': 'scl_Na',
+        'slurry concentration (g SrCO3/100 mL)': 'scl_Sr'
+    },
+    'ppm': {
+        'B (ppm)': 'init_B', 'Ca (ppm)': 'init_Ca', 'K (ppm)': 'init_K',
+        'Li (ppm)': 'init_Li', 'Mg (ppm)': 'init_Mg', 'Na (ppm)': 'init_Na',
+        'Si (ppm)': 'init_Si', 'Sr (ppm)': 'init_Sr', 'Li2CO3 purity (%)': 'init_Li_purity',
+        'B (ppm).1': 'fini_B', 'Ca (ppm).1': 'fini_Ca', 'K (ppm).1': 'fini_K',
+        'Li (ppm).1': 'fini_Li', 'Mg (ppm).1': 'fini_Mg', 'Na (ppm).1': 'fini_Na',
+        'Si (ppm).1': 'fini_Si', 'Sr (ppm).1': 'fini_Sr', 'Li2CO3 purity (%).1': 'fini_Li_purity'
+    },
+    'percentage': {
+        'B (%)': 'init_B', 'Ca (%)': 'init_Ca', 'K (%)': 'init_K', 'Li (%)': 'init_Li',
+        'Mg (%)': 'init_Mg', 'Na (%)': 'init_Na', 'Si (%)': 'init_Si', 'Sr (%)': 'init_Sr',
+        'B (%).1': 'fini_B', 'Ca (%).1': 'fini_Ca', 'K (%).1': 'fini_K', 'Li (%).1': 'fini_Li',
+        'Mg (%).1': 'fini_Mg', 'Na (%).1': 'fini_Na', 'Si (%).1': 'fini_Si', 'Sr (%).1': 'fini_Sr'
+    }
+}
+
+# Extracted columns that keep their raw dtype; all others are parsed as float32
+_NON_NUMERIC_COLUMNS = ('experiment_id', 'success', 'score')
+
+# sift_data_extractor flags, in bit order of the dispatch-table key
+_FLAG_BITS = ('ppm', 'pH', 'slurry', 'score', 'NaOH')
+
+# Battery-grade thresholds (ppm) for the final impurity concentrations
+_FINI_THRESHOLD = MappingProxyType({
+    'fini_Ca': 160,
+    'fini_K': 10,
+    'fini_Mg': 80,
+    'fini_Na': 500,
+    'fini_Si': 40
+})
+
+
+def _build_maps(mask: int) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """
+    Build the column mapping for one combination of extractor flags.
+    
+    Parameters:
+    -----------
+    mask : int
+        Flag combination, with bit i set when _FLAG_BITS[i] is enabled
+        
+    Returns:
+    --------
+    Tuple[Dict[str, str], Tuple[str, ...]]
+        Raw-to-standard column names in output order, and the standard
+        names of the numeric columns
+    """
+    ppm, pH, slurry, score, NaOH = (bool(mask >> bit & 1) for bit in range(len(_FLAG_BITS)))
+    
+    groups = ['basic']
+    if score:
+        groups.append('score')
+    groups.append('process')
+    if pH:
+        groups.append('pH')
+    if NaOH:
+        groups.append('NaOH')
+    if slurry:
+        groups.append('slurry')
+    groups.append('ppm' if ppm else 'percentage')
+    
+    rename_map = {raw: new for group in groups for raw, new in _RENAME_MAP[group].items()}
+    numeric_columns = tuple(new for new in rename_map.values() if new not in _NON_NUMERIC_COLUMNS)
+    return rename_map, numeric_columns
+
+
+# Column mappings for all 32 flag combinations, built once at import
+_EXTRACTION_TABLES = {mask: _build_maps(mask) for mask in range(1 << len(_FLAG_BITS))}
 
 
 def sift_data_extractor(data: pd.DataFrame, 
@@ -37,85 +138,33 @@ def sift_data_extractor(data: pd.DataFrame,
     Returns:
     --------
     pd.DataFrame
-        Standardized dataset with consistent column names and data types
+        Standardized dataset with consistent column names and data types.
+        Measurements are stored as float32, which covers the 4 significant
+        digits the instruments report at half the memory of float64
         
     Notes:
     ------
     This function handles the conversion from raw experimental data format
     to a standardized format suitable for machine learning analysis.
     """
-    new_data = pd.DataFrame()
-    
-    # Extract basic experiment information
-    if 'Experiment ID' in data.columns:
-        new_data['experiment_id'] = data['Experiment ID']
-    if 'Successful Experiment' in data.columns:
-        new_data['success'] = data['Successful Experiment']
-    else:
-        new_data['success'] = 'T'
-    
-    # Extract quality scores if requested
-    if score:
-        if 'Success score' in data.columns:
-            new_data['score'] = data['Success score']
-        else:
-            new_data['score'] = 1
-    
-    # Extract process parameters
-    if 'T cold (deg C)' in data.columns:
-        new_data['T_cold'] = data['T cold (deg C)'].astype(float)
-    if 'T hot (deg C)' in data.columns:
-        new_data['T_hot'] = data['T hot (deg C)'].astype(float)
-    if 'flow rate (mL/min)' in data.columns:
-        new_data['flow_rate'] = data['flow rate (mL/min)'].astype(float)
-    if 'slurry concentration (g total solid/100 mL)' in data.columns:
-        new_data['slurry_concentration'] = data['slurry concentration (g total solid/100 mL)'].astype(float)
-    
-    # Extract pH data if requested
-    if pH and 'pH of slurry (initial)' in data.columns:
-        new_data['pH'] = data['pH of slurry (initial)'].astype(float)
+
+    mask = bool(ppm) | bool(pH) << 1 | bool(slurry) << 2 | bool(score) << 3 | bool(NaOH) << 4
+    rename_map, numeric_columns = _EXTRACTION_TABLES[mask]
+    active_map = {raw: new for raw, new in rename_map.items() if raw in data.columns}
     
-    # Extract NaOH data if requested
-    if NaOH and 'millimoles NaOH added' in data.columns:
-        new_data['NaOH'] = data['millimoles NaOH added'].astype(float)
+    # Select and rename all extracted columns in one pass each, then parse
+    # the measurements straight to float32 (unparseable entries become NaN)
+    new_data = data[list(active_map)].rename(columns=active_map)
+    numeric_columns = [col for col in numeric_columns if col in new_data.columns]
+    if numeric_columns:
+        new_data[numeric_columns] = new_data[numeric_columns].apply(
+            pd.to_numeric, downcast='float', errors='coerce')
     
-    # Extract slurry component concentrations if requested
-    if slurry:
-        slurry_components = {
-            'slurry concentration (g CaCO3/100 mL)': 'scl_Ca',
-            'slurry concentration (g K2CO3/100 mL)': 'scl_K',
-            'slurry concentration (g Li2CO3/100 mL)': 'scl_Li',
-            'slurry concentration (g (Mg(CO3))4 Mg(OH)2/100 mL)': 'scl_Mg',
-            'slurry concentration (g Na2CO3/100 mL)': 'scl_Na',
-            'slurry concentration (g SrCO3/100 mL)': 'scl_Sr'
-        }
-        for column, new_column_name in slurry_components.items():
-            if column in data.columns:
-                new_data[new_column_name] = data[column].astype(float)
-    
-    # Extract concentration data (ppm or percentage)
-    if ppm:
-        ppm_components = {
-            'B (ppm)': 'init_B', 'Ca (ppm)': 'init_Ca', 'K (ppm)': 'init_K',
-            'Li (ppm)': 'init_Li', 'Mg (ppm)': 'init_Mg', 'Na (ppm)': 'init_Na',
-            'Si (ppm)': 'init_Si', 'Sr (ppm)': 'init_Sr', 'Li2CO3 purity (%)': 'init_Li_purity',
-            'B (ppm).1': 'fini_B', 'Ca (ppm).1': 'fini_Ca', 'K (ppm).1': 'fini_K',
-            'Li (ppm).1': 'fini_Li', 'Mg (ppm).1': 'fini_Mg', 'Na (ppm).1': 'fini_Na',
-            'Si (ppm).1': 'fini_Si', 'Sr (ppm).1': 'fini_Sr', 'Li2CO3 purity (%).1': 'fini_Li_purity'
-        }
-        for column, new_column_name in ppm_components.items():
-            if column in data.columns:
-                new_data[new_column_name] = data[column].astype(float)
-    else:
-        percentage_components = {
-            'B (%)': 'init_B', 'Ca (%)': 'init_Ca', 'K (%)': 'init_K', 'Li (%)': 'init_Li',
-            'Mg (%)': 'init_Mg', 'Na (%)': 'init_Na', 'Si (%)': 'init_Si', 'Sr (%)': 'init_Sr',
-            'B (%).1': 'fini_B', 'Ca (%).1': 'fini_Ca', 'K (%).1': 'fini_K', 'Li (%).1': 'fini_Li',
-            'Mg (%).1': 'fini_Mg', 'Na (%).1': 'fini_Na', 'Si (%).1': 'fini_Si', 'Sr (%).1': 'fini_Sr'
-        }
-        for column, new_column_name in percentage_components.items():
-            if column in data.columns:
-                new_data[new_column_name] = data[column].astype(float)
+    # Defaults for files that predate the success / score columns
+    if 'success' not in new_data.columns:
+        new_data.insert(int('experiment_id' in new_data.columns), 'success', 'T')
+    if score and 'score' not in new_data.columns:
+        new_data.insert(new_data.columns.get_loc('success') + 1, 'score', 1)
     
     return new_data
 
@@ -138,9 +187,11 @@ def successful_sift_extraction(data: pd.DataFrame) -> pd.DataFrame:
     ------
     This function is essential for model training as it ensures only
     high-quality experimental data is used for machine learning analysis.
+    The rows are selected with a single boolean mask and no further copy is
+    made; call ``.copy()`` on the result before modifying it in place.
     """
-    new_data = data[data['success'].isin(['T'])].copy()
-    return new_data
+    mask = data['success'].to_numpy() == 'T'
+    return data[mask]
 
 
 def ppm_threshold(element: str) -> Optional[int]:
@@ -162,11 +213,25 @@ def ppm_threshold(element: str) -> Optional[int]:
     These thresholds are based on industry standards for battery-grade
     lithium carbonate specifications.
     """
-    fini_threshold = {
-        'fini_Ca': 160,
-        'fini_K': 10,
-        'fini_Mg': 80,
-        'fini_Na': 500,
-        'fini_Si': 40
-    }
-    return fini_threshold.get(element) 
\ No newline at end of file
+    return _FINI_THRESHOLD.get(element)
+
+
+def ppm_threshold_vec(elements: Iterable[str]) -> np.ndarray:
+    """
+    Get the battery-grade thresholds for several elements at once.
+    
+    Parameters:
+    -----------
+    elements : Iterable[str]
+        Element names (e.g., ['fini_Ca', 'fini_Mg'])
+        
+    Returns:
+    --------
+    np.ndarray
+        Float array of thresholds in ppm, NaN where an element has none
+        
+    Notes:
+    ------
+    Vectorized counterpart of ppm_threshold for loops over many targets.
+    """
+    return pd.Series(_FINI_THRESHOLD, dtype=float).reindex(list(elements)).to_numpy() 
\ No newline at end of file
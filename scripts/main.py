@@ -16,6 +16,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scripts.data_loader import (
     load_cleaned_data, 
+    sync_cleaned_dataset,
+    load_cleaned_dataset,
     load_raw_data, 
     load_generated_data,
     prepare_analysis_dataset,
@@ -59,9 +61,10 @@ def main():
         print("\n1. LOADING EXPERIMENTAL DATA")
         print("-" * 40)
         
-        # Load cleaned data
+        # Load cleaned data through the Parquet dataset, which is rebuilt
+        # from Data/clean only when the CSV files change
         print("Loading cleaned experimental data...")
-        cleaned_data = load_cleaned_data()
+        cleaned_data = load_cleaned_dataset(sync_cleaned_dataset())
         
         # Generate data summary
         summary = get_data_summary(cleaned_data)
@@ -1,16 +1,237 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
-from platypus import NSGAII, Problem, Real, Integer
+from platypus import NSGAII, Problem, Real, Evaluator
 import warnings
 warnings.filterwarnings('ignore')
 
+# Numba is optional; without it the Pareto sweep runs in NumPy
+try:
+    from numba import njit, types
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+# Rows per block in the NumPy sweep, bounding its temporaries on huge inputs
+_SWEEP_BLOCK = 1 << 20
+
+
+def _pareto_mask_numpy(arr, order, block=_SWEEP_BLOCK):
+    """
+    NumPy version of _pareto_mask.
+    
+    The sweep runs over ``block`` rows at a time, carrying the running minimum
+    between blocks, so the gathered rows and accumulate buffers never exceed
+    one block instead of growing with the whole input.
+    """
+    n = order.shape[0]
+    mask = np.empty(n, dtype=bool)
+    best = np.inf
+    for start in range(0, n, block):
+        chunk = arr[order[start:start + block]]
+        valid = (chunk < np.inf).all(axis=1)
+        y = np.where(valid, chunk[:, 1], np.inf)
+        running = np.minimum.accumulate(y)
+        # Minimum over all earlier rows, this block's included
+        prev = np.empty_like(y)
+        prev[0] = best
+        np.minimum(running[:-1], best, out=prev[1:])
+        np.logical_and(valid, y < prev, out=mask[start:start + len(y)])
+        best = min(best, running[-1])
+    return mask
+
+
+if _NUMBA_AVAILABLE:
+    # An explicit signature compiles the sweep at import (or loads it from the
+    # on-disk cache) instead of on the first call. It is a serial kernel, so
+    # this does not start Numba's threading layer, which would make later
+    # fork-based process pools hang at exit; parallel kernels must stay lazy.
+    # The objective array is typed read-only so both writable arrays and
+    # pandas' read-only views match
+    _OBJ = types.Array(types.float64, 2, 'A', readonly=True)
+    
+    @njit(types.boolean[:](_OBJ, types.intp[:]), cache=True)
+    def _pareto_mask(arr, order):
+        """
+        Flag the Pareto optimal rows of ``arr`` visited in lexsorted ``order``.
+        
+        One pass keeps the running minimum of the second objective; a row is
+        optimal if its second objective is strictly below it. Rows with an
+        infinite objective are never optimal.
+        """
+        n = order.shape[0]
+        mask = np.zeros(n, dtype=np.bool_)
+        best = np.inf
+        for i in range(n):
+            x = arr[order[i], 0]
+            y = arr[order[i], 1]
+            if x < np.inf and y < best:
+                best = y
+                mask[i] = True
+        return mask
+else:
+    _pareto_mask = _pareto_mask_numpy
+
+
+class ParetoProblem(Problem):
+    """Platypus problem whose single decision variable is a row index of the data."""
+    
+    def __init__(self, objectives):
+        super().__init__(1, 2)  # 1 variable (index), 2 objectives
+        # (n, 2) objective values of every row, precomputed once: NSGA-II
+        # re-evaluates the same indices across generations, so evaluate()
+        # is a plain lookup. C order keeps both objectives of a row adjacent
+        # (pandas hands back column-major arrays)
+        self._obj = np.ascontiguousarray(objectives, dtype=np.float64)
+        # A Real variable over [0, n) floored to an index avoids the per-call
+        # bit-string decoding of Integer and gives every row equal width
+        self.types[0] = Real(0, len(self._obj))  # Index bounds
+        self.directions[0] = Problem.MINIMIZE  # Minimize both objectives
+        self.directions[1] = Problem.MINIMIZE
+    
+    def row_index(self, value):
+        """Map a decision variable value to a row index."""
+        return min(int(value), len(self._obj) - 1)
+        
+    def evaluate(self, solution):
+        idx = self.row_index(solution.variables[0])
+        obj = self._obj
+        solution.objectives[0] = obj[idx, 0]
+        solution.objectives[1] = obj[idx, 1]
+
+
+class _BatchEvaluator(Evaluator):
+    """
+    Evaluate a whole batch of ParetoProblem solutions with one NumPy gather.
+    
+    Stands in for platypus' per-solution Problem.__call__: the row indices of
+    the batch are collected into one array, their objectives fetched with a
+    single fancy index, and the solutions marked evaluated. The problem has
+    no constraints and its Real variable is not encoded, so nothing else from
+    __call__ is needed.
+    """
+    
+    def __init__(self, problem):
+        super().__init__()
+        self._obj = problem._obj
+    
+    def _objectives(self, idxs):
+        """Return the (len(idxs), 2) objective values of the given rows."""
+        return self._obj[idxs]
+    
+    def evaluate_all(self, jobs, **kwargs):
+        solutions = [job.solution for job in jobs]
+        idxs = np.fromiter((s.variables[0] for s in solutions),
+                           dtype=np.float64, count=len(solutions)).astype(np.intp)
+        np.minimum(idxs, len(self._obj) - 1, out=idxs)  # as ParetoProblem.row_index
+        for solution, (f1, f2) in zip(solutions, self._objectives(idxs).tolist()):
+            solution.objectives[0] = f1
+            solution.objectives[1] = f2
+            solution.constraint_violation = 0.0
+            solution.feasible = True
+            solution.evaluated = True
+        return jobs
+
+
+# Objective array of a worker process, set once by _init_worker
+_WORKER_OBJ = None
+
+
+def _init_worker(obj):
+    """Store the objective array in a worker process."""
+    global _WORKER_OBJ
+    _WORKER_OBJ = obj
+
+
+def _worker_objectives(idxs):
+    """Return the objective values of the given rows from the worker's array."""
+    return _WORKER_OBJ[idxs]
+
+
+class _ProcessBatchEvaluator(_BatchEvaluator):
+    """
+    _BatchEvaluator that splits each batch of row indices over worker processes.
+    
+    The objective array is sent to every worker once, when the pool starts,
+    so each batch only ships row indices out and objective pairs back rather
+    than pickling the problem with every solution. Workers are spawned, not
+    forked: a fork taken after Numba has started its threading layer leaves
+    the interpreter hanging at exit.
+    """
+    
+    def __init__(self, problem, processes):
+        super().__init__(problem)
+        self._processes = processes
+        self._executor = ProcessPoolExecutor(
+            processes, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker, initargs=(self._obj,))
+    
+    def _objectives(self, idxs):
+        chunks = np.array_split(idxs, self._processes)
+        return np.concatenate(list(self._executor.map(_worker_objectives, chunks)))
+    
+    def close(self):
+        self._executor.shutdown()
+
+
+def _exact_pareto_front(obj):
+    """
+    Return the positions of the Pareto optimal rows of ``obj`` exactly.
+    
+    Every candidate is a row of the data, so for two minimized objectives the
+    front is found by sorting on obj1 (ties broken by obj2) and keeping the
+    rows whose obj2 is strictly below that of every earlier row: O(n log n)
+    for the sort plus one compiled (or NumPy) pass. Strictness drops weakly
+    dominated rows, and rows repeating an objective pair already on the front,
+    so the positions come back unique and sorted by (obj1, obj2).
+    """
+    order = np.lexsort((obj[:, 1], obj[:, 0]))
+    return order[_pareto_mask(obj, order)]
+
+
+def _nsga2_pareto_front(obj, population_size, generations, processes=None):
+    """Return the positions of the Pareto optimal rows of ``obj`` found by NSGA-II, sorted."""
+    # Initialize problem and algorithm
+    problem = ParetoProblem(obj)
+    
+    # Run optimization, spreading each generation's evaluations over worker
+    # processes when requested
+    if processes is not None and processes > 1:
+        with _ProcessBatchEvaluator(problem, processes) as evaluator:
+            algorithm = NSGAII(problem, population_size=population_size, evaluator=evaluator)
+            algorithm.run(generations)
+    else:
+        algorithm = NSGAII(problem, population_size=population_size,
+                           evaluator=_BatchEvaluator(problem))
+        algorithm.run(generations)
+    
+    # Extract Pareto front as row positions, gathered straight into one array
+    # so the caller slices the data once
+    idxs = np.fromiter(
+        (problem.row_index(solution.variables[0]) for solution in algorithm.result
+         if solution.objectives[0] < float('inf') and solution.objectives[1] < float('inf')),
+        dtype=np.intp)
+    
+    # A converged population holds many copies of the same row; collapse them
+    # on the integer index before touching the objectives
+    idxs = np.unique(idxs)
+    
+    # Sweep the result like the exact path: one pass sorts, drops repeated
+    # objective pairs and anything the final population still dominates
+    return idxs[_exact_pareto_front(obj[idxs])]
+
+
 def optimize_pareto_front(df, obj1_col="fini_Mg", obj2_col="fini_Ca", 
-                         min_unique_points=30, population_size=100, generations=50):
+                         min_unique_points=30, population_size=100, generations=50,
+                         algorithm="exact", dtype=None, processes=None):
     """
-    Optimize Pareto front using NSGA-II algorithm for multi-objective optimization.
+    Optimize Pareto front for multi-objective optimization.
     
     This function finds the Pareto optimal solutions for minimizing two objectives
-    (typically impurity levels) using the NSGA-II evolutionary algorithm.
+    (typically impurity levels) among the rows of the input dataframe, either
+    exactly with a sort-and-sweep scan or with the NSGA-II evolutionary algorithm.
     
     Parameters:
     -----------
@@ -26,6 +247,22 @@ def optimize_pareto_front(df, obj1_col="fini_Mg", obj2_col="fini_Ca",
         Population size for NSGA-II algorithm
     generations : int, default=50
         Number of generations for NSGA-II algorithm
+    algorithm : str, default="exact"
+        "exact" computes the true Pareto front in O(n log n) by sorting on
+        obj1 and sweeping the running minimum of obj2. "nsga2" runs the
+        NSGA-II search (population_size and generations only apply here).
+        Inputs with at most 4 * population_size valid rows always use "exact"
+    dtype : numpy dtype, optional
+        Cast the objective-only front to this dtype (e.g. np.float32 to halve
+        its memory for plotting). The full data frame keeps its own dtypes.
+        Defaults to None, which keeps the input dtypes
+    processes : int, optional
+        Number of worker processes used to evaluate each NSGA-II generation.
+        The objective array is sent to each worker once, but an evaluation is
+        a single array lookup, so worker start-up and per-generation round
+        trips usually make this slower than the default serial run (None).
+        Workers are spawned, so scripts using this need an
+        ``if __name__ == "__main__":`` guard
     
     Returns:
     --------
@@ -35,9 +272,9 @@ def optimize_pareto_front(df, obj1_col="fini_Mg", obj2_col="fini_Ca",
     
     Notes:
     ------
-    - Uses modern pandas methods (pd.concat instead of deprecated append)
-    - Implements NSGA-II multi-objective optimization
-    - Filters for unique Pareto optimal solutions
+    - Builds the result with a single index-based slice (no per-row concat)
+    - Implements exact 2D Pareto scan and NSGA-II multi-objective optimization
+    - Filters for unique Pareto optimal solutions (unique objective pairs)
     - Handles edge cases and provides robust error handling
     """
     
@@ -55,62 +292,50 @@ def optimize_pareto_front(df, obj1_col="fini_Mg", obj2_col="fini_Ca",
         if not pd.api.types.is_numeric_dtype(df[obj1_col]) or not pd.api.types.is_numeric_dtype(df[obj2_col]):
             raise ValueError(f"Objective columns {obj1_col} and {obj2_col} must be numeric")
         
-        # Remove rows with NaN values in objective columns
-        df_clean = df.dropna(subset=[obj1_col, obj2_col]).copy()
-        if df_clean.empty:
+        # Remove rows with NaN values in objective columns. Only the two
+        # objective columns are copied; the wide frame is sliced once at the end
+        obj = df[required_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid_idx = np.flatnonzero(~np.isnan(obj).any(axis=1))
+        if valid_idx.size == 0:
             raise ValueError("No valid data after removing NaN values")
+        obj = obj[valid_idx]
         
-        # Create optimization problem
-        class ParetoProblem(Problem):
-            def __init__(self, data, obj1_col, obj2_col):
-                super().__init__(1, 2)  # 1 variable (index), 2 objectives
-                self.data = data
-                self.obj1_col = obj1_col
-                self.obj2_col = obj2_col
-                self.types[0] = Integer(0, len(data) - 1)  # Index bounds
-                self.directions[0] = Problem.MINIMIZE  # Minimize both objectives
-                self.directions[1] = Problem.MINIMIZE
-                
-            def evaluate(self, solution):
-                idx = int(solution.variables[0])
-                row = self.data.iloc[idx]
-                solution.objectives[0] = row[self.obj1_col]
-                solution.objectives[1] = row[self.obj2_col]
-        
-        # Initialize problem and algorithm
-        problem = ParetoProblem(df_clean, obj1_col, obj2_col)
-        algorithm = NSGAII(problem, population_size=population_size)
-        
-        # Run optimization
-        algorithm.run(generations)
-        
-        # Extract Pareto front
-        pareto_front_unique = pd.DataFrame(columns=df_clean.columns)
-        
-        for solution in algorithm.result:
-            if solution.objectives[0] < float('inf') and solution.objectives[1] < float('inf'):
-                idx = int(solution.variables[0])
-                pareto_row = df_clean.iloc[idx:idx+1]
-                
-                # Use pd.concat instead of deprecated append
-                pareto_front_unique = pd.concat([pareto_front_unique, pareto_row], ignore_index=False)
+        if algorithm == "nsga2" and len(obj) <= 4 * population_size:
+            # NSGA-II would evaluate every row several times over anyway; the
+            # exact scan gives the true front in a fraction of the time
+            print(f"Only {len(obj)} valid rows, using the exact Pareto scan instead of NSGA-II")
+            algorithm = "exact"
         
-        # Remove duplicates and sort
-        pareto_front_unique = pareto_front_unique.drop_duplicates()
-        pareto_front_unique = pareto_front_unique.sort_values([obj1_col, obj2_col])
+        if algorithm == "exact":
+            idxs = _exact_pareto_front(obj)
+        elif algorithm == "nsga2":
+            idxs = _nsga2_pareto_front(obj, population_size, generations, processes)
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Use 'exact' or 'nsga2'")
+        # Both paths return unique positions sorted by (obj1, obj2), so no
+        # separate drop_duplicates or sort_values pass is needed
+        pareto_front_unique = df.iloc[valid_idx[idxs]]
         
         # Ensure minimum unique points
         if len(pareto_front_unique) < min_unique_points:
             print(f"Warning: Only {len(pareto_front_unique)} unique Pareto points found (requested: {min_unique_points})")
         
-        # Create objective-only dataframe
-        pareto_front_df = pareto_front_unique[[obj1_col, obj2_col]].copy()
-        pareto_front_df = pareto_front_df.reset_index(drop=True)
+        # Create objective-only dataframe. With a requested dtype the sorted
+        # objective array is cast directly instead of going through pandas
+        if dtype is not None:
+            pareto_front_df = pd.DataFrame(obj[idxs].astype(dtype), columns=required_cols)
+        else:
+            # Column selection already yields a new frame (or a copy-on-write
+            # view), so relabel it in place rather than copying it twice more
+            pareto_front_df = pareto_front_unique[required_cols]
+            pareto_front_df.index = pd.RangeIndex(len(pareto_front_df))
         
         return pareto_front_df, pareto_front_unique
         
     except Exception as e:
         print(f"Error in optimize_pareto_front: {str(e)}")
-        # Return empty dataframes on error
-        empty_df = pd.DataFrame(columns=[obj1_col, obj2_col])
-        return empty_df, pd.DataFrame(columns=df.columns if not df.empty else []) 
\ No newline at end of file
+        # Return empty dataframes on error, keeping numeric dtypes instead of object.
+        # Built only here rather than ahead of the try, so successful calls pay
+        # nothing; the copy keeps the empty slice from pinning df's blocks
+        empty_df = pd.DataFrame(columns=[obj1_col, obj2_col], dtype=dtype or np.float64)
+        return empty_df, df.iloc[:0].copy() 
\ No newline at end of file
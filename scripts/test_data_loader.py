@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the Parquet dataset sync in data_loader.
+This script verifies that the dataset is rebuilt only when the cleaned CSV
+files change, and never stamped or written over when it should not be.
+
+Run from the repository root: python -m scripts.test_data_loader
+"""
+
+import os
+import time
+import tempfile
+from scripts.data_loader import sync_cleaned_dataset, load_cleaned_dataset
+
+
+def _write_csv(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def test_sync_rebuilds_on_change():
+    """Check that an unchanged dataset is reused and a changed one rebuilt."""
+
+    print("Testing Parquet dataset sync...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "clean")
+        dataset_dir = os.path.join(tmp, "clean_parquet")
+        os.makedirs(data_dir)
+        _write_csv(os.path.join(data_dir, "a.csv"), "x,y\n1,2\n3,4\n")
+
+        sync_cleaned_dataset(data_dir, dataset_dir)
+        stamp_path = os.path.join(dataset_dir, "_SOURCE_DIGEST")
+        if not os.path.exists(stamp_path):
+            print("❌ Dataset was written without a _SOURCE_DIGEST stamp")
+            return False
+        stamp_mtime = os.path.getmtime(stamp_path)
+
+        sync_cleaned_dataset(data_dir, dataset_dir)
+        if os.path.getmtime(stamp_path) != stamp_mtime:
+            print("❌ Unchanged dataset was rebuilt")
+            return False
+
+        time.sleep(0.01)
+        _write_csv(os.path.join(data_dir, "b.csv"), "x,y\n5,6\n")
+        if len(load_cleaned_dataset(sync_cleaned_dataset(data_dir, dataset_dir))) != 3:
+            print("❌ Dataset was not rebuilt after a CSV file was added")
+            return False
+
+        # A dataset left without its stamp (interrupted older run) is rebuilt
+        os.remove(stamp_path)
+        if len(load_cleaned_dataset(sync_cleaned_dataset(data_dir, dataset_dir))) != 3:
+            print("❌ Unstamped dataset was not rebuilt")
+            return False
+        if sorted(os.listdir(tmp)) != ["clean", "clean_parquet"]:
+            print(f"❌ Temporary directories left behind: {os.listdir(tmp)}")
+            return False
+
+    print("✅ Dataset reused when unchanged and rebuilt when the CSV files change")
+    return True
+
+
+def test_sync_rejects_partial_load():
+    """Check that a CSV that fails to load prevents the dataset from being stamped."""
+
+    print("\nTesting Parquet dataset sync with an unreadable CSV...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "clean")
+        dataset_dir = os.path.join(tmp, "clean_parquet")
+        os.makedirs(data_dir)
+        _write_csv(os.path.join(data_dir, "a.csv"), "x,y\n1,2\n")
+        _write_csv(os.path.join(data_dir, "bad.csv"), "x,y\n1,2\n3,4,5,6\n")
+
+        try:
+            sync_cleaned_dataset(data_dir, dataset_dir)
+            print("❌ Partial load was written as a dataset")
+            return False
+        except ValueError:
+            pass
+        if os.path.exists(dataset_dir):
+            print("❌ Dataset directory exists after a failed sync")
+            return False
+
+    print("✅ Unreadable CSV raises and no dataset is stamped")
+    return True
+
+
+def test_sync_refuses_foreign_directory():
+    """Check that a directory that is not a Parquet dataset is never removed."""
+
+    print("\nTesting Parquet dataset sync over a foreign directory...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "clean")
+        dataset_dir = os.path.join(tmp, "clean_parquet")
+        os.makedirs(data_dir)
+        os.makedirs(dataset_dir)
+        _write_csv(os.path.join(data_dir, "a.csv"), "x,y\n1,2\n")
+        _write_csv(os.path.join(dataset_dir, "notes.txt"), "keep me")
+
+        try:
+            sync_cleaned_dataset(data_dir, dataset_dir)
+            print("❌ Foreign directory was overwritten")
+            return False
+        except FileExistsError:
+            pass
+        if not os.path.exists(os.path.join(dataset_dir, "notes.txt")):
+            print("❌ Foreign directory contents were removed")
+            return False
+
+    print("✅ Foreign directory left untouched")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_sync_rebuilds_on_change()
+    success = test_sync_rejects_partial_load() and success
+    success = test_sync_refuses_foreign_directory() and success
+    if success:
+        print("\n🎉 All tests passed!")
+    else:
+        print("\n💥 Tests failed. Please check the error messages above.")
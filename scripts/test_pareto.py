@@ -4,9 +4,10 @@ Test script for the fixed optimize_pareto_front function.
 This script verifies that the pandas compatibility issue has been resolved.
 """
 
+import random
 import pandas as pd
 import numpy as np
-from pareto_optimization import optimize_pareto_front
+from pareto_optimization import optimize_pareto_front, ParetoProblem
 
 def test_pareto_optimization():
     """Test the Pareto optimization function with sample data."""
@@ -55,8 +56,151 @@ def test_pareto_optimization():
         traceback.print_exc()
         return False
 
+def brute_force_pareto(points):
+    """Return the set of non-dominated (obj1, obj2) pairs by pairwise comparison."""
+    front = set()
+    for i, (x, y) in enumerate(points):
+        dominated = any(
+            (ox <= x and oy <= y) and (ox < x or oy < y)
+            for j, (ox, oy) in enumerate(points) if j != i
+        )
+        if not dominated:
+            front.add((x, y))
+    return front
+
+
+def test_exact_front_matches_brute_force():
+    """Check the exact Pareto scan against a brute-force dominance check."""
+    
+    print("\nTesting exact Pareto front against brute force...")
+    
+    rng = np.random.default_rng(0)
+    n_samples = 300
+    
+    # Rounded values produce ties and duplicate points
+    sample_data = pd.DataFrame({
+        'fini_Mg': rng.integers(0, 40, n_samples).astype(float),
+        'fini_Ca': rng.integers(0, 40, n_samples).astype(float),
+        'experiment_id': range(n_samples)
+    })
+    sample_data.loc[::17, 'fini_Ca'] = np.nan
+    
+    pareto_front, pareto_data = optimize_pareto_front(
+        sample_data, obj1_col="fini_Mg", obj2_col="fini_Ca", min_unique_points=1
+    )
+    
+    valid = sample_data.dropna(subset=['fini_Mg', 'fini_Ca'])
+    expected = brute_force_pareto(list(zip(valid['fini_Mg'], valid['fini_Ca'])))
+    found = set(zip(pareto_front['fini_Mg'], pareto_front['fini_Ca']))
+    
+    if found != expected or len(pareto_front) != len(expected):
+        print(f"❌ Mismatch: expected {sorted(expected)}, got {sorted(found)}")
+        return False
+    if not pareto_front['fini_Mg'].is_monotonic_increasing:
+        print("❌ Pareto front is not sorted by the first objective")
+        return False
+    if not set(pareto_data.index) <= set(valid.index):
+        print("❌ Pareto data does not reference rows of the input")
+        return False
+    
+    print(f"✅ Exact front matches brute force ({len(expected)} points)")
+    return True
+
+
+def test_nsga2_front():
+    """Check that the NSGA-II search returns sorted input rows on or near the true front."""
+    
+    print("\nTesting NSGA-II Pareto search...")
+    
+    random.seed(0)  # platypus draws from the global random module
+    rng = np.random.default_rng(1)
+    n_samples = 500  # above 4 * population_size, so NSGA-II actually runs
+    sample_data = pd.DataFrame({
+        'fini_Mg': rng.uniform(10, 200, n_samples),
+        'fini_Ca': rng.uniform(5, 150, n_samples),
+        'experiment_id': range(n_samples)
+    })
+    
+    pareto_front, pareto_data = optimize_pareto_front(
+        sample_data, obj1_col="fini_Mg", obj2_col="fini_Ca",
+        min_unique_points=1, population_size=50, generations=2000, algorithm="nsga2"
+    )
+    
+    points = list(zip(pareto_front['fini_Mg'], pareto_front['fini_Ca']))
+    if not points:
+        print("❌ NSGA-II returned an empty front")
+        return False
+    if points != list(zip(pareto_data['fini_Mg'], pareto_data['fini_Ca'])):
+        print("❌ Objective-only front does not match the full data rows")
+        return False
+    if not pareto_data.index.isin(sample_data.index).all():
+        print("❌ Pareto data does not reference rows of the input")
+        return False
+    if (pareto_data != sample_data.loc[pareto_data.index]).any(axis=None):
+        print("❌ Pareto data rows differ from the input rows")
+        return False
+    if points != sorted(points):
+        print("❌ NSGA-II front is not sorted by the objectives")
+        return False
+    
+    true_front = brute_force_pareto(list(zip(sample_data['fini_Mg'], sample_data['fini_Ca'])))
+    on_front = sum(point in true_front for point in points)
+    if 2 * on_front < len(points):
+        print(f"❌ Only {on_front} of {len(points)} NSGA-II points are on the true front")
+        return False
+    
+    print(f"✅ NSGA-II returned {len(points)} points, {on_front} of the {len(true_front)} on the true front")
+    return True
+
+
+def test_nsga2_processes():
+    """Check that NSGA-II with worker processes finds the serial front without pickling the problem."""
+    
+    print("\nTesting NSGA-II with worker processes...")
+    
+    rng = np.random.default_rng(2)
+    n_samples = 300
+    sample_data = pd.DataFrame({
+        'fini_Mg': rng.uniform(10, 200, n_samples),
+        'fini_Ca': rng.uniform(5, 150, n_samples)
+    })
+    
+    def refuse_pickle(self, protocol):
+        raise RuntimeError("ParetoProblem was pickled for a worker")
+    
+    fronts = []
+    for processes in (None, 2):
+        random.seed(0)  # evaluation order differs, but variation happens in this process
+        # Workers must receive the objective array once, not the whole problem
+        # with every solution; pickling the problem makes the run fail
+        if processes:
+            ParetoProblem.__reduce_ex__ = refuse_pickle
+        try:
+            pareto_front, _ = optimize_pareto_front(
+                sample_data, min_unique_points=1, population_size=50,
+                generations=500, algorithm="nsga2", processes=processes
+            )
+        finally:
+            if processes:
+                del ParetoProblem.__reduce_ex__
+        fronts.append(pareto_front)
+    
+    if fronts[1].empty:
+        print("❌ NSGA-II with worker processes returned an empty front")
+        return False
+    if not fronts[0].equals(fronts[1]):
+        print("❌ Worker processes changed the NSGA-II front")
+        return False
+    
+    print(f"✅ NSGA-II with 2 worker processes returned the serial front ({len(fronts[1])} points)")
+    return True
+
+
 if __name__ == "__main__":
     success = test_pareto_optimization()
+    success = test_exact_front_matches_brute_force() and success
+    success = test_nsga2_front() and success
+    success = test_nsga2_processes() and success
     if success:
         print("\n🎉 All tests passed! The pandas compatibility issue has been resolved.")
     else:
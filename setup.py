@@ -63,6 +63,9 @@ setup(
             "sphinx-rtd-theme>=1.0.0",
             "nbsphinx>=0.8.0",
         ],
+        "speed": [
+            "numba>=0.57.0",
+        ],
     },
     include_package_data=True,
     package_data={